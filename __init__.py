@@ -1,7 +1,11 @@
 import bpy
+from bpy.app.handlers import persistent
 import time
 import json
+import bisect
+from functools import lru_cache
 import os
+import sys
 
 bl_info = {
     "name": "Blendrendest",
@@ -15,11 +19,20 @@ bl_info = {
 
 # --- Time-Based Activity Messages ---
 def _get_activities_path():
-    """Get the path to the time_activities.json file."""
+    """Get the path to the time_activities.json file.
+
+    The JSON is the input for generate_time_activities.py; rerun that script
+    after editing it, since time_activities_data.py is what gets loaded.
+    """
     return os.path.join(os.path.dirname(__file__), "time_activities.json")
 
 def _load_time_activities():
-    """Load time activities from JSON file."""
+    """Load time activities from JSON file.
+
+    Only used when time_activities_data.py is missing.
+    """
+    # Imported here so the generator script is only loaded on this fallback path
+    from .generate_time_activities import parse_activities
     json_path = _get_activities_path()
     
     # Default fallback activities
@@ -37,72 +50,121 @@ def _load_time_activities():
     
     try:
         with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            activities = []
-            for item in data.get("activities", []):
-                threshold = item.get("threshold", 0)
-                suggestion = item.get("suggestion", "")
-                if threshold and suggestion:
-                    activities.append((threshold, suggestion))
-            # Sort by threshold to ensure proper order
-            activities.sort(key=lambda x: x[0])
+            activities = parse_activities(json.load(f))
             return activities if activities else default_activities
     except (FileNotFoundError, json.JSONDecodeError, KeyError):
         return default_activities
 
-# Load activities at module import time
-TIME_ACTIVITIES = _load_time_activities()
+# Load activities at module import time. The pre-generated (and pre-sorted)
+# module is preferred; the JSON file is only parsed if it is missing.
+try:
+    from .time_activities_data import ACTIVITIES as TIME_ACTIVITIES
+except ImportError:
+    TIME_ACTIVITIES = _load_time_activities()
+
+# Keep the table immutable and intern the suggestions, since the same label
+# strings are handed to the UI on every redraw
+TIME_ACTIVITIES = tuple((threshold, sys.intern(suggestion)) for threshold, suggestion in TIME_ACTIVITIES)
+
+# Parallel lookup tables so get_activity_for_time can bisect the thresholds
+_THRESHOLDS = tuple(threshold for threshold, _ in TIME_ACTIVITIES)
+_SUGGESTIONS = tuple(suggestion for _, suggestion in TIME_ACTIVITIES)
 
 def get_activity_for_time(seconds):
     """Get the appropriate activity suggestion based on estimated time."""
     if seconds <= 0:
         return "Instant render!"
-    activity = TIME_ACTIVITIES[0][1]
-    for threshold, suggestion in TIME_ACTIVITIES:
-        if seconds >= threshold:
-            activity = suggestion
-        else:
-            break
-    return activity
+    idx = bisect.bisect_right(_THRESHOLDS, seconds)
+    return _SUGGESTIONS[max(0, idx - 1)]
 
 # --- Pre-Render Estimation Functions ---
-def get_scene_complexity(scene):
-    """Gather scene complexity metrics for estimation."""
-    # Count objects by type
-    mesh_count = sum(1 for obj in bpy.data.objects if obj.type == 'MESH' and obj.visible_get())
-    light_count = sum(1 for obj in bpy.data.objects if obj.type == 'LIGHT' and obj.visible_get())
-    volume_count = sum(1 for obj in bpy.data.objects if obj.type == 'VOLUME' and obj.visible_get())
-    
-    # Count total vertices in visible meshes
+BASELINE_PIXELS = 1920 * 1080  # Estimates are normalized to 1080p
+CYCLES_SAMPLE_SCALE = 1.0 / 100.0  # Cycles calibration is per 100 samples
+EEVEE_SAMPLE_SCALE = 1.0 / 64.0  # EEVEE calibration is per 64 samples
+VERTEX_COUNT_CAP = 50_000_000  # Vertex totals above this are clamped
+
+def _get_view_layer(scene, context=None):
+    """Get the view layer to estimate from, falling back to the scene's first one."""
+    view_layer = getattr(context or bpy.context, "view_layer", None)
+    if view_layer is None:
+        view_layer = scene.view_layers[0]
+    return view_layer
+
+def count_view_layer_objects(view_layer):
+    """Count visible meshes, lights, volumes and mesh vertices in a view layer.
+
+    The vertex total is capped at VERTEX_COUNT_CAP; past that point the
+    estimate is dominated by geometry anyway, so mesh data is no longer read.
+    """
+    # Count visible objects by type and their vertices in a single pass
+    # (type is checked first so visible_get() only runs for relevant objects)
+    type_counts = {'MESH': 0, 'LIGHT': 0, 'VOLUME': 0}
     total_verts = 0
-    for obj in bpy.data.objects:
-        if obj.type == 'MESH' and obj.visible_get() and obj.data:
+    for obj in view_layer.objects:
+        obj_type = obj.type
+        if obj_type not in type_counts or not obj.visible_get(view_layer=view_layer):
+            continue
+        type_counts[obj_type] += 1
+        if obj_type == 'MESH' and total_verts < VERTEX_COUNT_CAP and obj.data:
             total_verts += len(obj.data.vertices)
-    
+
+    return {
+        'mesh_count': type_counts['MESH'],
+        'light_count': type_counts['LIGHT'],
+        'volume_count': type_counts['VOLUME'],
+        'total_verts': min(total_verts, VERTEX_COUNT_CAP),
+    }
+
+# The object walk is only redone after depsgraph_update_handler marks it dirty
+# (or when a different view layer is asked for); resolution is always fresh
+_complexity_dirty = True
+_complexity_cache = {"key": None, "objects": None}
+
+def get_scene_complexity(scene, context=None):
+    """Gather scene complexity metrics for estimation."""
+    global _complexity_dirty
+    # Only objects in the active view layer can be rendered, so walk that
+    # instead of every object in the file
+    view_layer = _get_view_layer(scene, context)
+    key = (scene.name, view_layer.name)
+    if _complexity_dirty or _complexity_cache["key"] != key:
+        _complexity_cache["objects"] = count_view_layer_objects(view_layer)
+        _complexity_cache["key"] = key
+        _complexity_dirty = False
+    object_counts = _complexity_cache["objects"]
+
     # Resolution
     render = scene.render
-    res_x = render.resolution_x * (render.resolution_percentage / 100)
-    res_y = render.resolution_y * (render.resolution_percentage / 100)
+    res_scale = render.resolution_percentage / 100
+    res_x = render.resolution_x * res_scale
+    res_y = render.resolution_y * res_scale
     pixel_count = res_x * res_y
     
     return {
-        'mesh_count': mesh_count,
-        'light_count': light_count,
-        'volume_count': volume_count,
-        'total_verts': total_verts,
+        'mesh_count': object_counts['mesh_count'],
+        'light_count': object_counts['light_count'],
+        'volume_count': object_counts['volume_count'],
+        'total_verts': object_counts['total_verts'],
         'res_x': res_x,
         'res_y': res_y,
         'pixel_count': pixel_count,
+        'resolution_factor': pixel_count / BASELINE_PIXELS,
     }
 
 def get_addon_preferences():
-    """Get addon preferences."""
+    """Get addon preferences.
+
+    Look this up once per draw/handler call and pass it down; it must not be
+    kept across calls since reverting preferences frees the old struct.
+    """
     return bpy.context.preferences.addons[__name__].preferences
 
-def estimate_cycles_render_time(scene, complexity):
-    """Estimate render time for Cycles engine."""
+def build_cycles_estimator(scene, prefs):
+    """Build a Cycles estimator with the scene's render settings baked in.
+
+    The returned function only takes the complexity dict.
+    """
     cycles = scene.cycles
-    prefs = get_addon_preferences()
     
     # Base samples
     samples = cycles.samples
@@ -123,57 +185,48 @@ def estimate_cycles_render_time(scene, complexity):
     # Denoiser adds small overhead but reduces needed samples
     denoiser_factor = 0.9 if cycles.use_denoising else 1.0
     
-    # Resolution factor (normalized to 1080p as baseline)
-    baseline_pixels = 1920 * 1080
-    resolution_factor = complexity['pixel_count'] / baseline_pixels
-    
-    # Object complexity factor
-    # More objects and vertices = more ray intersections
-    object_factor = 1.0 + (complexity['mesh_count'] * 0.01) + (complexity['total_verts'] / 1000000)
-    
-    # Light complexity factor
-    # More lights = more shadow rays
-    light_factor = 1.0 + (complexity['light_count'] * 0.05)
-    
-    # Volume factor (volumes are expensive)
-    volume_factor = 1.0 + (complexity['volume_count'] * 0.3)
-    
     # Base calibration constant (seconds per 100 samples at 1080p baseline)
     # This is a rough estimate - actual time varies wildly by hardware
     calibration = prefs.calibration_factor
     
-    # Calculate estimated time
-    estimated_time = (
-        (effective_samples / 100) *
-        resolution_factor *
-        object_factor *
-        light_factor *
-        volume_factor *
+    # Everything that doesn't depend on scene complexity
+    base_time = (
+        effective_samples * CYCLES_SAMPLE_SCALE *
         fast_gi_factor *
         denoiser_factor *
         calibration
     )
     
-    return max(1, estimated_time)  # Minimum 1 second
+    def estimate(complexity):
+        # Resolution factor (normalized to 1080p as baseline)
+        resolution_factor = complexity['resolution_factor']
+        
+        # Object complexity factor
+        # More objects and vertices = more ray intersections
+        object_factor = 1.0 + (complexity['mesh_count'] * 0.01) + (complexity['total_verts'] / 1000000)
+        
+        # Light complexity factor
+        # More lights = more shadow rays
+        light_factor = 1.0 + (complexity['light_count'] * 0.05)
+        
+        # Volume factor (volumes are expensive)
+        volume_factor = 1.0 + (complexity['volume_count'] * 0.3)
+        
+        estimated_time = base_time * resolution_factor * object_factor * light_factor * volume_factor
+        return max(1, estimated_time)  # Minimum 1 second
+    
+    return estimate
 
-def estimate_eevee_render_time(scene, complexity):
-    """Estimate render time for EEVEE engine."""
+def build_eevee_estimator(scene, prefs):
+    """Build an EEVEE estimator with the scene's render settings baked in.
+
+    The returned function only takes the complexity dict.
+    """
     eevee = scene.eevee
-    prefs = get_addon_preferences()
     
     # EEVEE samples
     samples = eevee.taa_render_samples
     
-    # Resolution factor
-    baseline_pixels = 1920 * 1080
-    resolution_factor = complexity['pixel_count'] / baseline_pixels
-    
-    # Object complexity (EEVEE is less affected by geometry)
-    object_factor = 1.0 + (complexity['mesh_count'] * 0.005)
-    
-    # Light complexity
-    light_factor = 1.0 + (complexity['light_count'] * 0.02)
-    
     # EEVEE-specific features
     volumetrics_factor = 1.3 if eevee.use_volumetric_lights else 1.0
     ssr_factor = 1.15 if eevee.use_ssr else 1.0
@@ -182,92 +235,229 @@ def estimate_eevee_render_time(scene, complexity):
     # Base calibration for EEVEE (much faster than Cycles)
     calibration = prefs.calibration_factor * 0.1
     
-    estimated_time = (
-        (samples / 64) *
-        resolution_factor *
-        object_factor *
-        light_factor *
+    # Everything that doesn't depend on scene complexity
+    base_time = (
+        samples * EEVEE_SAMPLE_SCALE *
         volumetrics_factor *
         ssr_factor *
         ao_factor *
         calibration
     )
     
-    return max(0.5, estimated_time)  # Minimum 0.5 seconds
+    def estimate(complexity):
+        # Resolution factor
+        resolution_factor = complexity['resolution_factor']
+        
+        # Object complexity (EEVEE is less affected by geometry)
+        object_factor = 1.0 + (complexity['mesh_count'] * 0.005)
+        
+        # Light complexity
+        light_factor = 1.0 + (complexity['light_count'] * 0.02)
+        
+        estimated_time = base_time * resolution_factor * object_factor * light_factor
+        return max(0.5, estimated_time)  # Minimum 0.5 seconds
+    
+    return estimate
 
-def estimate_single_frame_time(scene):
-    """Estimate render time for a single frame."""
-    complexity = get_scene_complexity(scene)
+def _estimate_fallback(complexity):
+    # Fallback for other engines
+    return 5.0  # Default 5 seconds
+
+def build_engine_estimator(scene, prefs):
+    """Build the estimator for the scene's current render engine."""
     engine = scene.render.engine
     
     if engine == 'CYCLES':
-        return estimate_cycles_render_time(scene, complexity)
+        return build_cycles_estimator(scene, prefs)
     elif engine == 'BLENDER_EEVEE_NEXT' or engine == 'BLENDER_EEVEE':
-        return estimate_eevee_render_time(scene, complexity)
+        return build_eevee_estimator(scene, prefs)
+    else:
+        return _estimate_fallback
+
+def _get_estimator_key(scene, prefs):
+    """Collect every setting the engine estimator bakes in."""
+    engine = scene.render.engine
+    if engine == 'CYCLES':
+        cycles = scene.cycles
+        settings = (
+            cycles.samples,
+            cycles.use_adaptive_sampling,
+            cycles.adaptive_threshold,
+            cycles.use_fast_gi,
+            cycles.use_denoising,
+        )
+    elif engine in ('BLENDER_EEVEE_NEXT', 'BLENDER_EEVEE'):
+        eevee = scene.eevee
+        settings = (
+            eevee.taa_render_samples,
+            eevee.use_volumetric_lights,
+            eevee.use_ssr,
+            eevee.use_gtao,
+        )
+    else:
+        settings = ()
+    return (engine, settings, prefs.calibration_factor)
+
+# The specialized estimator is reused until one of its baked-in settings
+# changes, e.g. across estimate cache misses caused by object edits
+_estimator_cache = {"key": None, "fn": None}
+
+def _estimate_for_engine(scene, complexity, prefs):
+    """Estimate single frame render time from precomputed complexity."""
+    key = _get_estimator_key(scene, prefs)
+    if _estimator_cache["key"] != key:
+        _estimator_cache["fn"] = build_engine_estimator(scene, prefs)
+        _estimator_cache["key"] = key
+    return _estimator_cache["fn"](complexity)
+
+# --- Estimate Cache ---
+# Panels redraw constantly, so estimates are kept until the scene signature
+# changes or a depsgraph update marks them stale.
+_estimate_cache = {"sig": None, "single": None, "anim": None, "complexity": None}
+
+def _get_estimate_signature(scene, context, prefs):
+    """Build a cheap signature of the settings that affect the estimate."""
+    view_layer = _get_view_layer(scene, context)
+    render = scene.render
+    engine = render.engine
+    if engine == 'CYCLES':
+        samples = scene.cycles.samples
+    elif engine in ('BLENDER_EEVEE_NEXT', 'BLENDER_EEVEE'):
+        samples = scene.eevee.taa_render_samples
     else:
-        # Fallback for other engines
-        return 5.0  # Default 5 seconds
+        samples = None
+    return (
+        scene.name,
+        view_layer.name,
+        len(view_layer.objects),
+        scene.frame_start,
+        scene.frame_end,
+        engine,
+        render.resolution_x,
+        render.resolution_y,
+        render.resolution_percentage,
+        samples,
+        prefs.calibration_factor,
+    )
+
+def _get_cached_estimates(scene, context=None, prefs=None):
+    """Return the estimate cache, recomputing it if the scene changed."""
+    if prefs is None:
+        prefs = get_addon_preferences()
+    sig = _get_estimate_signature(scene, context, prefs)
+    if _estimate_cache["sig"] != sig:
+        complexity = get_scene_complexity(scene, context)
+        single = _estimate_for_engine(scene, complexity, prefs)
+        _estimate_cache["complexity"] = complexity
+        _estimate_cache["single"] = single
+        _estimate_cache["anim"] = estimate_animation_time(scene, frame_time=single)
+        _estimate_cache["sig"] = sig
+    return _estimate_cache
+
+def invalidate_estimate_cache():
+    """Force the next estimate to be recomputed."""
+    _estimate_cache["sig"] = None
+
+@persistent
+def depsgraph_update_handler(scene, depsgraph):
+    global _complexity_dirty
+    _complexity_dirty = True
+    invalidate_estimate_cache()
+
+@persistent
+def load_post_handler(*args):
+    # Scene/view layer names repeat across .blend files, so a newly loaded
+    # file must not reuse the previous file's cached complexity
+    global _complexity_dirty
+    _complexity_dirty = True
+    invalidate_estimate_cache()
+
+def estimate_single_frame_time(scene, context=None, prefs=None):
+    """Estimate render time for a single frame."""
+    return _get_cached_estimates(scene, context, prefs)["single"]
 
-def estimate_animation_time(scene):
-    """Estimate total render time for animation."""
-    frame_time = estimate_single_frame_time(scene)
+def estimate_animation_time(scene, context=None, frame_time=None, prefs=None):
+    """Estimate total render time for animation.
+
+    If frame_time is given it is used as the per-frame estimate instead of
+    looking the single frame estimate up again.
+    """
+    if frame_time is None:
+        return _get_cached_estimates(scene, context, prefs)["anim"]
     total_frames = scene.frame_end - scene.frame_start + 1
     return frame_time * total_frames
 
-def get_estimation_breakdown(scene):
-    """Get detailed breakdown of estimation factors (for debug mode)."""
-    complexity = get_scene_complexity(scene)
+@lru_cache(maxsize=8)
+def format_breakdown_lines(engine, res_x, res_y, pixel_count, mesh_count, light_count,
+                           volume_count, total_verts, engine_settings):
+    """Format the breakdown as "name: value" lines (memoized, inputs rarely change)."""
+    lines = [
+        "engine: %s" % engine,
+        "resolution: %dx%d" % (res_x, res_y),
+        "pixels: %.2fM" % (pixel_count / 1000000),
+        "meshes: %d" % mesh_count,
+        "lights: %d" % light_count,
+        "volumes: %d" % volume_count,
+        "vertices: %.1fK" % (total_verts / 1000),
+    ]
+    lines.extend("%s: %s" % setting for setting in engine_settings)
+    return tuple(lines)
+
+def get_estimation_breakdown(scene, context=None, complexity=None):
+    """Get detailed breakdown of estimation factors (for debug mode).
+
+    Returns a tuple of preformatted "name: value" lines ready for display.
+    """
+    if complexity is None:
+        complexity = get_scene_complexity(scene, context)
     engine = scene.render.engine
     
-    breakdown = {
-        'engine': engine,
-        'resolution': f"{int(complexity['res_x'])}x{int(complexity['res_y'])}",
-        'pixels': f"{complexity['pixel_count'] / 1000000:.2f}M",
-        'meshes': complexity['mesh_count'],
-        'lights': complexity['light_count'],
-        'volumes': complexity['volume_count'],
-        'vertices': f"{complexity['total_verts'] / 1000:.1f}K",
-    }
-    
     if engine == 'CYCLES':
         cycles = scene.cycles
-        breakdown['samples'] = cycles.samples
-        breakdown['adaptive'] = cycles.use_adaptive_sampling
+        engine_settings = [
+            ("samples", cycles.samples),
+            ("adaptive", cycles.use_adaptive_sampling),
+        ]
         if cycles.use_adaptive_sampling:
-            breakdown['noise_threshold'] = cycles.adaptive_threshold
-        breakdown['fast_gi'] = cycles.use_fast_gi
-        breakdown['denoiser'] = cycles.use_denoising
+            engine_settings.append(("noise_threshold", cycles.adaptive_threshold))
+        engine_settings.append(("fast_gi", cycles.use_fast_gi))
+        engine_settings.append(("denoiser", cycles.use_denoising))
     elif engine in ('BLENDER_EEVEE_NEXT', 'BLENDER_EEVEE'):
         eevee = scene.eevee
-        breakdown['samples'] = eevee.taa_render_samples
-        breakdown['volumetrics'] = eevee.use_volumetric_lights
-        breakdown['ssr'] = eevee.use_ssr
-        breakdown['ao'] = eevee.use_gtao
+        engine_settings = [
+            ("samples", eevee.taa_render_samples),
+            ("volumetrics", eevee.use_volumetric_lights),
+            ("ssr", eevee.use_ssr),
+            ("ao", eevee.use_gtao),
+        ]
+    else:
+        engine_settings = []
     
-    return breakdown
+    return format_breakdown_lines(
+        engine,
+        complexity['res_x'],
+        complexity['res_y'],
+        complexity['pixel_count'],
+        complexity['mesh_count'],
+        complexity['light_count'],
+        complexity['volume_count'],
+        complexity['total_verts'],
+        tuple(engine_settings),
+    )
 
 # --- Time Formatting Functions ---
 def format_time_HHMMSS(sec):
-    sec = int(sec)
-    days = sec // 86400
-    sec %= 86400
-    hours = sec // 3600
-    sec %= 3600
-    minutes = sec // 60
-    seconds = sec % 60
+    days, sec = divmod(int(sec), 86400)
+    hours, sec = divmod(sec, 3600)
+    minutes, seconds = divmod(sec, 60)
     if days > 0:
-        return f"{days}d {hours:02}:{minutes:02}:{seconds:02}"
-    else:
-        return f"{hours:02}:{minutes:02}:{seconds:02}"
+        return "%dd %02d:%02d:%02d" % (days, hours, minutes, seconds)
+    return "%02d:%02d:%02d" % (hours, minutes, seconds)
 
 def format_time_human(sec):
-    sec = int(sec)
-    days = sec // 86400
-    sec %= 86400
-    hours = sec // 3600
-    sec %= 3600
-    minutes = sec // 60
-    seconds = sec % 60
+    days, sec = divmod(int(sec), 86400)
+    hours, sec = divmod(sec, 3600)
+    minutes, seconds = divmod(sec, 60)
     parts = []
     if days:
         parts.append(f"{days} day{'s' if days != 1 else ''}")
@@ -279,26 +469,134 @@ def format_time_human(sec):
         parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
     return ", ".join(parts)
 
-# --- Global State Variables ---
-_frame_start = {}
-_total_start = None
-_first_rendered_frame = None
-_last_frame_time = 0.0
-_last_eta_human = "AWAITING RENDER"
-_last_eta_HHMMSS = "AWAITING RENDER"
-_progress = 0.0
-_is_rendering = False
-_total_time = None
-_avg_time = None
+# --- Global State ---
+class _State:
+    """Render tracking state shared by the handlers, operators and draw code."""
+    __slots__ = (
+        'current_frame_start',
+        'total_start',
+        'first_rendered_frame',
+        'ema_frame_time',
+        'last_eta_human',
+        'last_eta_HHMMSS',
+        'progress',
+        'is_rendering',
+        'total_time',
+        'avg_time',
+        'single_frame_render',
+        'single_frame_start',
+        'detected_animation',
+        'pre_render_estimate',
+        'cached_remaining',
+        'cached_remaining_str',
+        'cached_elapsed_str',
+    )
+
+    def __init__(self):
+        self.current_frame_start = None  # Start time of the frame being rendered
+        self.total_start = None
+        self.first_rendered_frame = None
+        self.ema_frame_time = 0.0  # Smoothed frame time used for the ETA
+        self.last_eta_human = "AWAITING RENDER"
+        self.last_eta_HHMMSS = "AWAITING RENDER"
+        self.progress = 0.0
+        self.is_rendering = False
+        self.total_time = None
+        self.avg_time = None
+
+        # Single frame render state
+        self.single_frame_render = False
+        self.single_frame_start = None
+        self.detected_animation = False  # True once we confirm this is an animation (multiple frames)
+
+        # Auto-calibration state
+        self.pre_render_estimate = None  # Stores the estimated time before render starts (for auto-calibration)
+
+        # Live timer strings (see _update_timer_strings)
+        self.cached_remaining = 0.0
+        self.cached_remaining_str = format_time_HHMMSS(0)
+        self.cached_elapsed_str = format_time_HHMMSS(0)
+
+STATE = _State()
 BAR_LENGTH = 25
+ETA_SMOOTHING = 0.3  # Weight of the newest frame in the smoothed frame time
+
+# --- Live Timer ---
+# Remaining/Elapsed strings are refreshed by a 1 Hz timer while rendering,
+# so the draw callbacks only read them instead of formatting on every redraw
+TIMER_INTERVAL = 1.0
+
+def _update_timer_strings():
+    """Recompute the live timer strings. Returns True if any of them changed."""
+    now = time.time()
+    if STATE.single_frame_render and STATE.single_frame_start:
+        elapsed = now - STATE.single_frame_start
+        remaining = max(0, estimate_single_frame_time(bpy.context.scene) - elapsed)
+    elif STATE.total_start:
+        elapsed = now - STATE.total_start
+        remaining = 0.0
+    else:
+        elapsed = 0.0
+        remaining = 0.0
+    remaining_str = format_time_HHMMSS(remaining)
+    elapsed_str = format_time_HHMMSS(elapsed)
+    changed = remaining_str != STATE.cached_remaining_str or elapsed_str != STATE.cached_elapsed_str
+    STATE.cached_remaining = remaining
+    STATE.cached_remaining_str = remaining_str
+    STATE.cached_elapsed_str = elapsed_str
+    return changed
+
+# Regions that display the timer strings: the sidebar panels and the
+# Image Editor header
+_TIMER_REDRAW_REGIONS = {
+    'IMAGE_EDITOR': {'UI', 'HEADER'},
+    'VIEW_3D': {'UI'},
+}
 
-# Single frame render state
-_single_frame_render = False
-_single_frame_start = None
-_detected_animation = False  # True once we confirm this is an animation (multiple frames)
+def _timer_strings_shown():
+    """Check whether any header or panel currently displays a timer string."""
+    if STATE.single_frame_render:
+        return STATE.single_frame_start is not None
+    if STATE.first_rendered_frame is None:
+        return False
+    # Animations only show the elapsed time while the first frame renders
+    return bpy.context.scene.frame_current - STATE.first_rendered_frame + 1 <= 1
 
-# Auto-calibration state
-_pre_render_estimate = None  # Stores the estimated time before render starts (for auto-calibration)
+def _tag_redraw_regions():
+    """Redraw only the regions showing our header or panels."""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            region_types = _TIMER_REDRAW_REGIONS.get(area.type)
+            if region_types is None:
+                continue
+            for region in area.regions:
+                if region.type in region_types:
+                    region.tag_redraw()
+
+def _reset_timer_strings():
+    """Clear the live timer strings without touching the scene.
+
+    Safe to call from render handlers, which may run on the render thread.
+    """
+    STATE.cached_remaining = 0.0
+    STATE.cached_remaining_str = format_time_HHMMSS(0)
+    STATE.cached_elapsed_str = format_time_HHMMSS(0)
+
+def _tick():
+    # Runs for the whole session on the main thread; idle ticks, and ticks
+    # where no timer string is on screen, do nothing
+    if STATE.is_rendering and _timer_strings_shown() and _update_timer_strings():
+        _tag_redraw_regions()
+    return TIMER_INTERVAL
+
+def register_render_timer():
+    # Only call from the main thread: bpy.app.timers is not thread-safe
+    if not bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.register(_tick, first_interval=TIMER_INTERVAL, persistent=True)
+
+def unregister_render_timer():
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
 
 # --- Progress Bar Utility ---
 def progress_bar(cur, total):
@@ -309,37 +607,41 @@ def progress_bar(cur, total):
 
 # --- Header Drawing ---
 def draw_header(self, context):
+    # The header is redrawn very often; until a render has run there is
+    # nothing to report, so skip the layout work entirely. The cheap STATE
+    # checks come first so preferences are only looked up when needed.
+    if not STATE.is_rendering and STATE.last_eta_human == "AWAITING RENDER":
+        if not get_addon_preferences().persistent_progress:
+            return
     scene = context.scene
     layout = self.layout
     row = layout.row(align=True)
     row.alignment = 'RIGHT'
 
-    if _is_rendering:
-        if _single_frame_render:
+    if STATE.is_rendering:
+        if STATE.single_frame_render:
             # Single frame render - show countdown (remaining time)
             icon = "RENDER_STILL"
-            single_est = estimate_single_frame_time(scene)
-            if _single_frame_start:
-                elapsed = time.time() - _single_frame_start
-                remaining = max(0, single_est - elapsed)
-                status = f"Remaining: {format_time_HHMMSS(remaining)}"
+            if STATE.single_frame_start:
+                status = f"Remaining: {STATE.cached_remaining_str}"
             else:
+                single_est = estimate_single_frame_time(scene, context, get_addon_preferences())
                 status = f"Est: {format_time_human(single_est)}"
             pb_text = ""
             alert_flag = False
-        elif _first_rendered_frame is not None:
+        elif STATE.first_rendered_frame is not None:
             # Animation render
-            current_frame_index = scene.frame_current - _first_rendered_frame + 1
-            total_frames = scene.frame_end - _first_rendered_frame + 1
+            current_frame_index = scene.frame_current - STATE.first_rendered_frame + 1
+            total_frames = scene.frame_end - STATE.first_rendered_frame + 1
             pb_text = progress_bar(current_frame_index, total_frames)
             if current_frame_index <= 1:
                 # First frame - show formula estimate
-                anim_time = estimate_animation_time(scene)
+                anim_time = estimate_animation_time(scene, context, prefs=get_addon_preferences())
                 eta_text = format_time_human(anim_time)
                 icon = "PREVIEW_RANGE"
                 alert_flag = False
             else:
-                eta_text = _last_eta_human if _last_eta_human else "Calculating ETA"
+                eta_text = STATE.last_eta_human if STATE.last_eta_human else "Calculating ETA"
                 icon = "RENDER_ANIMATION"
                 alert_flag = eta_text in {"Calculating ETA", "RENDER STOPPED"}
             status = f"ETA: {eta_text}"
@@ -349,12 +651,12 @@ def draw_header(self, context):
             icon = "TIME"
             alert_flag = True
     else:
-        status = _last_eta_human
+        status = STATE.last_eta_human
         pb_text = ""
         icon = "FILE_REFRESH"
-        if _last_eta_human.startswith("RENDER COMPLETE"):
+        if STATE.last_eta_human.startswith("RENDER COMPLETE"):
             icon = "CHECKMARK"
-        elif _last_eta_human == "RENDER STOPPED":
+        elif STATE.last_eta_human == "RENDER STOPPED":
             icon = "CANCEL"
         alert_flag = False
 
@@ -366,142 +668,140 @@ def draw_header(self, context):
 
 # --- State Reset and Handler Functions ---
 def reset_render_state(persistent_progress, is_single_frame=False, scene=None):
-    global _frame_start, _total_start, _first_rendered_frame
-    global _last_eta_human, _last_eta_HHMMSS, _progress, _is_rendering, _total_time, _avg_time
-    global _single_frame_render, _single_frame_start, _last_frame_time, _detected_animation
-    global _pre_render_estimate
-    _frame_start.clear()
-    _total_start = None
-    _last_frame_time = 0.0
-    _first_rendered_frame = None
-    _progress = 0.0
-    _detected_animation = False
-    _pre_render_estimate = None
+    STATE.current_frame_start = None
+    STATE.total_start = None
+    STATE.ema_frame_time = 0.0
+    STATE.first_rendered_frame = None
+    STATE.progress = 0.0
+    STATE.detected_animation = False
+    STATE.pre_render_estimate = None
     if not persistent_progress:
-        _total_time = None
-        _avg_time = None
-    _last_eta_human = "Calculating ETA"
-    _last_eta_HHMMSS = "Calculating ETA"
-    _is_rendering = True
+        STATE.total_time = None
+        STATE.avg_time = None
+    STATE.last_eta_human = "Calculating ETA"
+    STATE.last_eta_HHMMSS = "Calculating ETA"
+    STATE.is_rendering = True
     # Set single frame mode
-    _single_frame_render = is_single_frame
+    STATE.single_frame_render = is_single_frame
     if is_single_frame:
-        _single_frame_start = time.time()
+        STATE.single_frame_start = time.time()
     else:
-        _single_frame_start = None
+        STATE.single_frame_start = None
         # Store pre-render estimate for auto-calibration (animation only)
         if scene is not None:
             prefs = get_addon_preferences()
             if prefs.auto_calibrate:
-                _pre_render_estimate = estimate_animation_time(scene)
+                STATE.pre_render_estimate = estimate_animation_time(scene, prefs=prefs)
+    # Called from our operators on the main thread, so the scene can be read
+    _update_timer_strings()
 
+@persistent
 def render_init_handler(scene):
-    global _is_rendering, _total_start, _single_frame_render, _single_frame_start
-    global _first_rendered_frame, _last_eta_human, _last_eta_HHMMSS, _progress
-    global _total_time, _avg_time, _last_frame_time, _detected_animation, _pre_render_estimate
-    
     # If state wasn't set by our operators (user used F12 or Blender menu),
     # we need to detect and initialize properly
-    if not _is_rendering:
+    if not STATE.is_rendering:
         # Fresh render not started by our operators - reset everything
-        _is_rendering = True
-        _total_start = time.time()
-        _first_rendered_frame = None
-        _last_frame_time = 0.0
-        _progress = 0.0
-        _total_time = None
-        _avg_time = None
-        _last_eta_human = "Calculating ETA"
-        _last_eta_HHMMSS = "Calculating ETA"
-        _detected_animation = False
-        _pre_render_estimate = None  # Will be set in render_pre if animation detected
+        STATE.is_rendering = True
+        STATE.total_start = time.time()
+        STATE.first_rendered_frame = None
+        STATE.ema_frame_time = 0.0
+        STATE.progress = 0.0
+        STATE.total_time = None
+        STATE.avg_time = None
+        STATE.last_eta_human = "Calculating ETA"
+        STATE.last_eta_HHMMSS = "Calculating ETA"
+        STATE.detected_animation = False
+        STATE.pre_render_estimate = None  # Will be set in render_pre if animation detected
         # Assume single frame mode for native renders (F12)
         # Will switch to animation mode if we detect multiple frames in render_pre
-        _single_frame_render = True
-        _single_frame_start = time.time()
-    elif _total_start is None:
-        _total_start = time.time()
+        STATE.single_frame_render = True
+        STATE.single_frame_start = time.time()
+        _reset_timer_strings()
+    elif STATE.total_start is None:
+        STATE.total_start = time.time()
 
+@persistent
 def render_pre_handler(scene):
-    global _total_start, _first_rendered_frame, _single_frame_render, _detected_animation, _pre_render_estimate
     cur = scene.frame_current
-    _frame_start[cur] = time.time()
-    if _first_rendered_frame is None:
-        _first_rendered_frame = cur
-        _total_start = time.time()
+    STATE.current_frame_start = time.time()
+    if STATE.first_rendered_frame is None:
+        STATE.first_rendered_frame = cur
+        STATE.total_start = time.time()
     else:
         # We're rendering a second frame - this is definitely an animation
-        if not _detected_animation:
-            _detected_animation = True
-            _single_frame_render = False
+        if not STATE.detected_animation:
+            STATE.detected_animation = True
+            STATE.single_frame_render = False
             # Capture pre-render estimate for auto-calibration if not already set
             # (handles native Blender animation renders not started by our operator)
-            if _pre_render_estimate is None:
+            if STATE.pre_render_estimate is None:
                 prefs = get_addon_preferences()
                 if prefs.auto_calibrate:
-                    _pre_render_estimate = estimate_animation_time(scene)
-    if _total_start is None:
-        _total_start = time.time()
+                    STATE.pre_render_estimate = estimate_animation_time(scene, prefs=prefs)
+    if STATE.total_start is None:
+        STATE.total_start = time.time()
 
+@persistent
 def render_post_handler(scene):
-    global _last_frame_time, _last_eta_human, _last_eta_HHMMSS, _progress
     cur = scene.frame_current
-    if _first_rendered_frame is None:
+    if STATE.first_rendered_frame is None:
         return
-    frame_index = cur - _first_rendered_frame + 1
-    total_frames = scene.frame_end - _first_rendered_frame + 1
-    t = time.time() - _frame_start.get(cur, time.time())
-    _last_frame_time = t
+    frame_index = cur - STATE.first_rendered_frame + 1
+    total_frames = scene.frame_end - STATE.first_rendered_frame + 1
+    frame_start = STATE.current_frame_start
+    t = time.time() - frame_start if frame_start is not None else 0.0
+    # Smooth the frame time so a single slow/fast frame doesn't make the ETA jump
+    if STATE.ema_frame_time:
+        STATE.ema_frame_time = ETA_SMOOTHING * t + (1.0 - ETA_SMOOTHING) * STATE.ema_frame_time
+    else:
+        STATE.ema_frame_time = t
     # After first frame completes, we have real timing data - use it!
     remaining = scene.frame_end - cur
     if remaining > 0:
-        predicted = _last_frame_time * remaining
-        _last_eta_human = format_time_human(predicted)
-        _last_eta_HHMMSS = format_time_HHMMSS(predicted)
+        predicted = STATE.ema_frame_time * remaining
+        STATE.last_eta_human = format_time_human(predicted)
+        STATE.last_eta_HHMMSS = format_time_HHMMSS(predicted)
     else:
-        _last_eta_human = "Finishing..."
-        _last_eta_HHMMSS = "Finishing..."
-    _progress = frame_index / total_frames
+        STATE.last_eta_human = "Finishing..."
+        STATE.last_eta_HHMMSS = "Finishing..."
+    STATE.progress = frame_index / total_frames
     prefs = get_addon_preferences()
     if prefs.show_debug:
         dbg_pb = progress_bar(frame_index, total_frames)
-        print(f"[Blendrendest] Frame {cur}: {dbg_pb} | Time: {t:.2f}s | ETA: {_last_eta_human} [{_last_eta_HHMMSS}]")
+        print(f"[Blendrendest] Frame {cur}: {dbg_pb} | Time: {t:.2f}s | ETA: {STATE.last_eta_human} [{STATE.last_eta_HHMMSS}]")
 
+@persistent
 def render_complete_handler(scene):
-    global _last_eta_human, _last_eta_HHMMSS, _is_rendering, _total_time, _avg_time
-    global _single_frame_render, _single_frame_start, _detected_animation, _pre_render_estimate
-    
-    if _single_frame_render:
+    prefs = get_addon_preferences()
+    if STATE.single_frame_render:
         # Single frame render completed
-        total = time.time() - _single_frame_start if _single_frame_start else 0
-        _total_time = total
-        _avg_time = total
-        _last_eta_human = "RENDER COMPLETE"
-        _last_eta_HHMMSS = f"RENDER COMPLETE | Time: {format_time_HHMMSS(total)}"
-        prefs = get_addon_preferences()
+        total = time.time() - STATE.single_frame_start if STATE.single_frame_start else 0
+        STATE.total_time = total
+        STATE.avg_time = total
+        STATE.last_eta_human = "RENDER COMPLETE"
+        STATE.last_eta_HHMMSS = f"RENDER COMPLETE | Time: {format_time_HHMMSS(total)}"
         if prefs.show_debug:
             print(f"[Blendrendest] Single frame render complete. Time: {total:.2f}s")
-        _single_frame_render = False
-        _single_frame_start = None
-        _detected_animation = False
+        STATE.single_frame_render = False
+        STATE.single_frame_start = None
+        STATE.detected_animation = False
     else:
         # Animation render completed
-        total_frames = scene.frame_end - _first_rendered_frame + 1 if _first_rendered_frame is not None else 0
-        total = time.time() - _total_start if _total_start else 0
+        total_frames = scene.frame_end - STATE.first_rendered_frame + 1 if STATE.first_rendered_frame is not None else 0
+        total = time.time() - STATE.total_start if STATE.total_start else 0
         avg = total / total_frames if total_frames else 0
-        _total_time = total
-        _avg_time = avg
-        _last_eta_human = "RENDER COMPLETE"
-        _last_eta_HHMMSS = f"RENDER COMPLETE | Total: {format_time_HHMMSS(total)}, Avg: {format_time_HHMMSS(avg)}"
-        prefs = get_addon_preferences()
+        STATE.total_time = total
+        STATE.avg_time = avg
+        STATE.last_eta_human = "RENDER COMPLETE"
+        STATE.last_eta_HHMMSS = f"RENDER COMPLETE | Total: {format_time_HHMMSS(total)}, Avg: {format_time_HHMMSS(avg)}"
         if prefs.show_debug:
             print(f"[Blendrendest] Render complete. Total: {total:.2f}s, Avg: {avg:.2f}s/frame")
         
         # Auto-calibration for animation renders
-        if prefs.auto_calibrate and _pre_render_estimate is not None and _pre_render_estimate > 0 and total > 0:
+        if prefs.auto_calibrate and STATE.pre_render_estimate is not None and STATE.pre_render_estimate > 0 and total > 0:
             # Calculate correction factor: how much we need to adjust
             # If estimated was 100s and actual was 200s, correction = 2.0
-            correction = total / _pre_render_estimate
+            correction = total / STATE.pre_render_estimate
             
             # Calculate new calibration factor
             new_cal_factor = prefs.calibration_factor * correction
@@ -513,42 +813,48 @@ def render_complete_handler(scene):
             averaged_factor = max(0.1, min(50.0, averaged_factor))
             
             if prefs.show_debug:
-                print(f"[Blendrendest] Auto-calibrate: Est={_pre_render_estimate:.1f}s, Actual={total:.1f}s, "
+                print(f"[Blendrendest] Auto-calibrate: Est={STATE.pre_render_estimate:.1f}s, Actual={total:.1f}s, "
                       f"Correction={correction:.3f}, OldCal={prefs.calibration_factor:.3f}, NewCal={averaged_factor:.3f}")
             
             # Update the preference
             prefs.calibration_factor = averaged_factor
         
-        _detected_animation = False
-        _pre_render_estimate = None
+        STATE.detected_animation = False
+        STATE.pre_render_estimate = None
     
-    _is_rendering = False
+    STATE.is_rendering = False
 
+@persistent
 def render_cancel_handler(scene):
-    global _last_eta_human, _last_eta_HHMMSS, _is_rendering
-    global _single_frame_render, _single_frame_start, _detected_animation, _pre_render_estimate
-    _last_eta_human = "RENDER STOPPED"
-    _last_eta_HHMMSS = "RENDER STOPPED"
-    _is_rendering = False
-    _single_frame_render = False
-    _single_frame_start = None
-    _detected_animation = False
-    _pre_render_estimate = None  # Don't calibrate on cancelled renders
+    STATE.last_eta_human = "RENDER STOPPED"
+    STATE.last_eta_HHMMSS = "RENDER STOPPED"
+    STATE.is_rendering = False
+    STATE.single_frame_render = False
+    STATE.single_frame_start = None
+    STATE.detected_animation = False
+    STATE.pre_render_estimate = None  # Don't calibrate on cancelled renders
     prefs = get_addon_preferences()
     if prefs.show_debug:
         print("[Blendrendest] Render cancelled.")
 
+# --- Class Registry ---
+_CLASSES = []
+
+def _register(cls):
+    """Class decorator adding cls to the list registered by register()."""
+    _CLASSES.append(cls)
+    return cls
+
 # --- Operator Definition ---
+@_register
 class RTE_OT_RenderAnimationWithETA(bpy.types.Operator):
     bl_idname = "rte.render_animation_with_eta"
     bl_label = "Render Animation with ETA"
     bl_description = "Render animation and estimate render time"
 
     def execute(self, context):
-        global _is_rendering
-        if not _is_rendering:
+        if not STATE.is_rendering:
             prefs = get_addon_preferences()
-            register_render_handlers()
             reset_render_state(prefs.persistent_progress, is_single_frame=False, scene=context.scene)
             bpy.ops.render.render('INVOKE_DEFAULT', animation=True)
             return {'FINISHED'}
@@ -556,16 +862,15 @@ class RTE_OT_RenderAnimationWithETA(bpy.types.Operator):
             return {'CANCELLED'}
 
 # --- Operators ---
+@_register
 class RTE_OT_RenderSingleWithETA(bpy.types.Operator):
     bl_idname = "rte.render_single_with_eta"
     bl_label = "Render Single Frame"
     bl_description = "Render current frame with time estimation"
 
     def execute(self, context):
-        global _is_rendering
-        if not _is_rendering:
+        if not STATE.is_rendering:
             prefs = get_addon_preferences()
-            register_render_handlers()
             reset_render_state(prefs.persistent_progress, is_single_frame=True)
             bpy.ops.render.render('INVOKE_DEFAULT', animation=False)
             return {'FINISHED'}
@@ -578,17 +883,18 @@ def draw_main_panel(layout, context):
     prefs = get_addon_preferences()
 
     # --- Pre-Render Estimation Box ---
-    if not _is_rendering:
+    if not STATE.is_rendering:
         est_box = layout.box()
         est_box.label(text="Pre-Render Estimate", icon='PREVIEW_RANGE')
         
-        # Single frame estimate
-        single_time = estimate_single_frame_time(scene)
+        # Single frame estimate (complexity is reused for the breakdown below)
+        estimates = _get_cached_estimates(scene, context, prefs)
+        single_time = estimates["single"]
         est_box.label(text=f"Single Frame: {format_time_human(single_time)}")
         
         # Animation estimate
         total_frames = scene.frame_end - scene.frame_start + 1
-        anim_time = estimate_animation_time(scene)
+        anim_time = estimate_animation_time(scene, frame_time=single_time)
         est_box.label(text=f"Animation ({total_frames} frames): {format_time_human(anim_time)}")
         
         # Activity suggestions for both single frame and animation
@@ -609,20 +915,20 @@ def draw_main_panel(layout, context):
         
         # Estimation breakdown (if enabled in preferences)
         if prefs.show_estimation_breakdown:
-            breakdown = get_estimation_breakdown(scene)
+            breakdown_lines = get_estimation_breakdown(scene, complexity=estimates["complexity"])
             breakdown_box = est_box.box()
             breakdown_box.label(text="Estimation Factors:", icon='VIEWZOOM')
             col = breakdown_box.column(align=True)
             col.scale_y = 0.8
-            for key, value in breakdown.items():
-                col.label(text=f"{key}: {value}")
+            for line in breakdown_lines:
+                col.label(text=line)
 
     # --- Render Buttons ---
     row = layout.row(align=True)
     row.scale_y = 1.5
-    row.enabled = not _is_rendering
+    row.enabled = not STATE.is_rendering
     
-    if _is_rendering:
+    if STATE.is_rendering:
         row.operator(RTE_OT_RenderAnimationWithETA.bl_idname, text="RENDERING...", icon='RENDER_ANIMATION')
     else:
         row.operator(RTE_OT_RenderAnimationWithETA.bl_idname, text="Animation", icon='RENDER_ANIMATION')
@@ -633,64 +939,62 @@ def draw_main_panel(layout, context):
     info_box.label(text="Render Status", icon='INFO')
 
     status_icon = "FILE_REFRESH"
-    if _is_rendering:
-        if _single_frame_render:
+    if STATE.is_rendering:
+        if STATE.single_frame_render:
             # Show countdown for single frame render
-            single_time = estimate_single_frame_time(scene)
+            single_time = estimate_single_frame_time(scene, context, prefs)
             info_box.label(text=f"Estimated: {format_time_human(single_time)}", icon='PREVIEW_RANGE')
             info_box.label(text="STATUS: RENDERING FRAME", icon=status_icon)
-            if _single_frame_start:
-                elapsed = time.time() - _single_frame_start
-                remaining = max(0, single_time - elapsed)
-                info_box.label(text=f"Remaining: {format_time_HHMMSS(remaining)}")
-                info_box.label(text=f"Elapsed: {format_time_HHMMSS(elapsed)}")
+            if STATE.single_frame_start:
+                info_box.label(text=f"Remaining: {STATE.cached_remaining_str}")
+                info_box.label(text=f"Elapsed: {STATE.cached_elapsed_str}")
                 # Activity suggestion based on remaining time
-                info_box.label(text=get_activity_for_time(remaining), icon='TIME')
-        elif _first_rendered_frame is not None:
-            current_frame_index = scene.frame_current - _first_rendered_frame + 1
-            total_frames = scene.frame_end - _first_rendered_frame + 1
+                info_box.label(text=get_activity_for_time(STATE.cached_remaining), icon='TIME')
+        elif STATE.first_rendered_frame is not None:
+            current_frame_index = scene.frame_current - STATE.first_rendered_frame + 1
+            total_frames = scene.frame_end - STATE.first_rendered_frame + 1
             status_display_text = f"RENDERING FRAME {current_frame_index} OF {total_frames}"
             info_box.label(text=f"STATUS: {status_display_text}", icon=status_icon)
             
             if current_frame_index <= 1:
                 # First frame - show formula estimate like single frame
-                anim_time = estimate_animation_time(scene)
+                anim_time = estimate_animation_time(scene, context, prefs=prefs)
                 info_box.label(text=f"Estimated: {format_time_human(anim_time)}", icon='PREVIEW_RANGE')
-                if _total_start:
-                    elapsed = time.time() - _total_start
-                    info_box.label(text=f"Elapsed: {format_time_HHMMSS(elapsed)}")
+                if STATE.total_start:
+                    info_box.label(text=f"Elapsed: {STATE.cached_elapsed_str}")
                 info_box.label(text=get_activity_for_time(anim_time), icon='TIME')
             else:
-                info_box.label(text=f"ETA: [{_last_eta_HHMMSS}]")
+                info_box.label(text=f"ETA: [{STATE.last_eta_HHMMSS}]")
                 # Activity suggestion during render
-                if _last_frame_time > 0:
+                if STATE.ema_frame_time > 0:
                     remaining_frames = scene.frame_end - scene.frame_current
-                    remaining_time = _last_frame_time * remaining_frames
+                    remaining_time = STATE.ema_frame_time * remaining_frames
                     info_box.label(text=get_activity_for_time(remaining_time), icon='TIME')
         else:
             info_box.label(text="STATUS: Starting...", icon=status_icon)
     else:
         # Not currently rendering - show last status
-        if _last_eta_human.startswith("RENDER COMPLETE"):
+        if STATE.last_eta_human.startswith("RENDER COMPLETE"):
             status_icon = "CHECKMARK"
             status_text = "STATUS: RENDER COMPLETE"
-        elif _last_eta_human == "RENDER STOPPED":
+        elif STATE.last_eta_human == "RENDER STOPPED":
             status_icon = "CANCEL"
             status_text = "STATUS: RENDER STOPPED"
-        elif _last_eta_human == "AWAITING RENDER":
+        elif STATE.last_eta_human == "AWAITING RENDER":
             status_icon = "FILE_REFRESH"
             status_text = "STATUS: Ready to render"
         else:
             status_icon = "FILE_REFRESH"
-            status_text = f"STATUS: {_last_eta_human}"
+            status_text = f"STATUS: {STATE.last_eta_human}"
         info_box.label(text=status_text, icon=status_icon)
 
-    if _total_time is not None:
-        info_box.label(text=f"Total Time: {format_time_HHMMSS(_total_time)}", icon='SORTTIME')
-    if _avg_time is not None:
-        info_box.label(text=f"Avg Time/Frame: {format_time_HHMMSS(_avg_time)}", icon='CLOCK')
+    if STATE.total_time is not None:
+        info_box.label(text=f"Total Time: {format_time_HHMMSS(STATE.total_time)}", icon='SORTTIME')
+    if STATE.avg_time is not None:
+        info_box.label(text=f"Avg Time/Frame: {format_time_HHMMSS(STATE.avg_time)}", icon='CLOCK')
 
 # --- Panel Definitions ---
+@_register
 class RTE_PT_Panel(bpy.types.Panel):
     bl_label = "Blendrendest"
     bl_idname = "RTE_PT_panel"
@@ -702,6 +1006,7 @@ class RTE_PT_Panel(bpy.types.Panel):
         draw_main_panel(self.layout, context)
 
 
+@_register
 class RTE_PT_Panel_3DView(bpy.types.Panel):
     bl_label = "Blendrendest"
     bl_idname = "RTE_PT_panel_3dview"
@@ -712,6 +1017,7 @@ class RTE_PT_Panel_3DView(bpy.types.Panel):
     def draw(self, context):
         draw_main_panel(self.layout, context)
 
+@_register
 class RTE_AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
     
@@ -750,53 +1056,62 @@ class RTE_AddonPreferences(bpy.types.AddonPreferences):
         
         layout.label(text="Estimation Settings", icon='PREVIEW_RANGE')
         box = layout.box()
-        box.prop(self, "calibration_factor")
-        box.prop(self, "auto_calibrate")
-        box.prop(self, "show_estimation_breakdown")
+        col = box.column(align=True)
+        col.prop(self, "calibration_factor")
+        col.prop(self, "auto_calibrate")
+        col.prop(self, "show_estimation_breakdown")
         
         layout.label(text="Render Settings", icon='RENDER_ANIMATION')
         box = layout.box()
-        box.prop(self, "persistent_progress")
-        box.prop(self, "show_debug")
-
-classes = (
-    RTE_AddonPreferences,
-    RTE_OT_RenderAnimationWithETA,
-    RTE_OT_RenderSingleWithETA,
-    RTE_PT_Panel,
-    RTE_PT_Panel_3DView,
-)
+        col = box.column(align=True)
+        col.prop(self, "persistent_progress")
+        col.prop(self, "show_debug")
+
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(tuple(_CLASSES))
 
 # --- Handler Registration Functions ---
-def register_render_handlers():
+# (bpy.app.handlers list name, callback) for every app handler we install
+_HANDLER_TABLE = (
+    ("render_init", render_init_handler),
+    ("render_pre", render_pre_handler),
+    ("render_post", render_post_handler),
+    ("render_complete", render_complete_handler),
+    ("render_cancel", render_cancel_handler),
+    ("depsgraph_update_post", depsgraph_update_handler),
+    ("load_post", load_post_handler),
+)
+_installed_handlers = set()  # id() of each handler we have appended
+
+def register_handlers():
+    handlers = bpy.app.handlers
     # Avoid duplicate handlers
-    if render_init_handler not in bpy.app.handlers.render_init:
-        bpy.app.handlers.render_init.append(render_init_handler)
-        bpy.app.handlers.render_pre.append(render_pre_handler)
-        bpy.app.handlers.render_post.append(render_post_handler)
-        bpy.app.handlers.render_complete.append(render_complete_handler)
-        bpy.app.handlers.render_cancel.append(render_cancel_handler)
-
-def unregister_render_handlers():
-    if render_init_handler in bpy.app.handlers.render_init:
-        bpy.app.handlers.render_init.remove(render_init_handler)
-        bpy.app.handlers.render_pre.remove(render_pre_handler)
-        bpy.app.handlers.render_post.remove(render_post_handler)
-        bpy.app.handlers.render_complete.remove(render_complete_handler)
-        bpy.app.handlers.render_cancel.remove(render_cancel_handler)
+    for name, fn in _HANDLER_TABLE:
+        if id(fn) not in _installed_handlers:
+            getattr(handlers, name).append(fn)
+            _installed_handlers.add(id(fn))
+
+def unregister_handlers():
+    handlers = bpy.app.handlers
+    for name, fn in _HANDLER_TABLE:
+        if id(fn) in _installed_handlers:
+            handler_list = getattr(handlers, name)
+            if fn in handler_list:
+                handler_list.remove(fn)
+            _installed_handlers.discard(id(fn))
 
 # --- Registration ---
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     bpy.types.IMAGE_HT_header.append(draw_header)
-    register_render_handlers()
+    register_handlers()
+    register_render_timer()
 
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
     bpy.types.IMAGE_HT_header.remove(draw_header)
-    unregister_render_handlers()
+    unregister_handlers()
+    unregister_render_timer()
+    invalidate_estimate_cache()
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""Regenerate time_activities_data.py from time_activities.json.
+
+Run with plain Python (Blender is not needed) after editing the JSON file:
+
+    python generate_time_activities.py
+"""
+import json
+import os
+
+_ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+JSON_PATH = os.path.join(_ADDON_DIR, "time_activities.json")
+DATA_PATH = os.path.join(_ADDON_DIR, "time_activities_data.py")
+
+def parse_activities(data):
+    """Turn parsed JSON data into (threshold, suggestion) pairs sorted by threshold.
+
+    Shared with the addon's JSON fallback loader so both apply the same rules.
+    """
+    activities = []
+    for item in data.get("activities", []):
+        threshold = item.get("threshold", 0)
+        suggestion = item.get("suggestion", "")
+        if threshold and suggestion:
+            activities.append((threshold, suggestion))
+    activities.sort(key=lambda x: x[0])
+    return activities
+
+def main():
+    with open(JSON_PATH, 'r', encoding='utf-8') as f:
+        activities = parse_activities(json.load(f))
+    lines = [
+        "# Generated from time_activities.json by generate_time_activities.py - do not edit.",
+        "ACTIVITIES = (",
+    ]
+    for threshold, suggestion in activities:
+        lines.append(f"    ({threshold!r}, {suggestion!r}),")
+    lines.append(")")
+    with open(DATA_PATH, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"Wrote {len(activities)} activities to {DATA_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Generated from time_activities.json by generate_time_activities.py - do not edit.
+ACTIVITIES = (
+    (5, 'Instant Render!'),
+    (10, "Blink and you'll miss it"),
+    (15, 'Time to take a deep breath'),
+    (20, 'Count to twenty'),
+    (30, 'Perfect time to stretch'),
+    (45, 'Do some neck rolls'),
+    (60, 'Grab a glass of water'),
+    (90, 'Check your posture'),
+    (120, 'Check your phone notifications'),
+    (150, 'Reply to a text message'),
+    (180, 'Perfect time for a coffee break'),
+    (240, 'Water your desk plant'),
+    (300, 'Do some quick desk exercises'),
+    (360, 'Tidy up your desk'),
+    (420, 'Refill your water bottle'),
+    (480, 'Check your email inbox'),
+    (540, 'Scroll through some memes'),
+    (600, 'Go for a short walk'),
+    (720, 'Make yourself a snack'),
+    (900, 'Meditate for a bit'),
+    (1080, 'Watch a YouTube video'),
+    (1200, 'Read a chapter of a book'),
+    (1500, 'Do a quick workout'),
+    (1800, 'Watch an episode of your favorite show'),
+    (2100, 'Take a shower'),
+    (2400, 'Play a quick game'),
+    (2700, 'Cook yourself a nice snack'),
+    (3000, 'Catch up on the news'),
+    (3300, 'Listen to a podcast episode'),
+    (3600, 'Take a power nap'),
+    (4200, 'Do some laundry'),
+    (4800, 'Clean your room'),
+    (5400, 'Call a friend or family member'),
+    (6000, 'Watch a documentary'),
+    (6600, 'Learn something new online'),
+    (7200, 'Go out for lunch'),
+    (9000, 'Go grocery shopping'),
+    (10800, 'Watch a movie'),
+    (12600, 'Take a long walk in nature'),
+    (14400, 'Time for a proper break - hit the gym'),
+    (16200, 'Visit a local cafe'),
+    (18000, 'Work on a hobby project'),
+    (21600, 'Go explore the outdoors'),
+    (25200, 'Have dinner with friends'),
+    (28800, 'Render overnight and sleep well'),
+    (32400, 'Binge-watch a TV season'),
+    (36000, 'Take a half-day trip somewhere'),
+    (43200, 'Plan a day trip while waiting'),
+    (50400, 'Read an entire book'),
+    (57600, 'Learn a new recipe and cook it'),
+    (64800, 'Have a full day adventure'),
+    (72000, 'Start learning a new skill'),
+    (86400, 'This might take a while - consider optimizing your scene'),
+    (129600, 'Time for a weekend getaway'),
+    (172800, 'Seriously - optimize your scene or upgrade your hardware'),
+    (259200, 'Consider render farm services'),
+    (604800, 'This render will outlive most houseplants'),
+    (2592000, 'What did you do to your scene?!'),
+)